@@ -25,9 +25,12 @@ boundary.
    import bezier
 """
 
+import numpy as np
+
 from bezier import _helpers
 from bezier import _plot_helpers
 from bezier import _triangle_helpers
+from bezier.hazmat import helpers as _py_helpers
 
 
 class CurvedPolygon:
@@ -120,58 +123,37 @@ class CurvedPolygon:
     Args:
         edges (Tuple[~bezier.curve.Curve, ...]): The boundary edges
             of the curved polygon.
-        kwargs: There are two keyword arguments accepted:
-
-            * ``metadata`` (:class:`~typing.Sequence`): A sequence of triples
-              associated with this curved polygon. This is intended to be used
-              by callers that have created a curved polygon as an intersection
-              between two B |eacute| zier triangles.
-            * ``_verify`` (:class:`bool`): Indicates if the edges should be
-              verified as having shared endpoints. Defaults to :data:`True`.
-
-            Other keyword arguments specified will be silently ignored.
+        metadata (Optional[~typing.Sequence]): A sequence of triples
+            associated with this curved polygon. This is intended to be used
+            by callers that have created a curved polygon as an intersection
+            between two B |eacute| zier triangles.
+        eps (float): The relative error threshold used when verifying that
+            consecutive edges share an endpoint (see
+            :func:`~bezier.hazmat.helpers.vector_close`). Defaults to
+            :math:`2^{-40}`.
+        _verify (bool): Indicates if the edges should be verified as having
+            shared endpoints. Defaults to :data:`True`.
+        unused_kwargs: Other keyword arguments specified will be silently
+            ignored.
     """
 
     __slots__ = ("_edges", "_num_sides", "_metadata")
 
-    def __init__(self, *edges, **kwargs):
+    def __init__(
+        self,
+        *edges,
+        metadata=None,
+        eps=0.5 ** 40,
+        _verify=True,
+        **unused_kwargs
+    ):
         self._edges = edges
         self._num_sides = len(edges)
-        self._metadata = kwargs.pop("metadata", None)
-        if kwargs.pop("_verify", True):
-            self._verify()
-
-    @staticmethod
-    def _verify_pair(prev, curr):
-        """Verify a pair of sides share an endpoint.
-
-        .. note::
-
-           This currently checks that edge endpoints match **exactly**
-           but allowing some roundoff may be desired.
+        self._metadata = metadata
+        if _verify:
+            self._verify(eps)
 
-        Args:
-            prev (.Curve): "Previous" curve at piecewise junction.
-            curr (.Curve): "Next" curve at piecewise junction.
-
-        Raises:
-            ValueError: If the previous side is not in 2D.
-            ValueError: If consecutive sides don't share an endpoint.
-        """
-        if prev._dimension != 2:
-            raise ValueError("Curve not in R^2", prev)
-
-        end = prev._nodes[:, -1]
-        start = curr._nodes[:, 0]
-        if not _helpers.vector_close(end, start):
-            raise ValueError(
-                "Not sufficiently close",
-                "Consecutive sides do not have common endpoint",
-                prev,
-                curr,
-            )
-
-    def _verify(self):
+    def _verify(self, eps):
         """Verify that the edges define a curved polygon.
 
         This may not be entirely comprehensive, e.g. won't check
@@ -179,8 +161,13 @@ class CurvedPolygon:
 
         .. note::
 
-           This currently checks that edge endpoints match **exactly**
-           but allowing some roundoff may be desired.
+           Edge endpoints are not required to match **exactly**, rather
+           to within a relative error of ``eps``. This allows edges that
+           were computed numerically (e.g. from an intersection) to be used
+           directly.
+
+        Args:
+            eps (float): The relative error threshold for shared endpoints.
 
         Raises:
             ValueError: If there are fewer than two sides.
@@ -190,12 +177,45 @@ class CurvedPolygon:
         if self._num_sides < 2:
             raise ValueError("At least two sides required.")
 
-        for prev, curr in zip(self._edges, self._edges[1:]):
-            self._verify_pair(prev, curr)
-        # Now we check that the final edge wraps around.
-        prev = self._edges[-1]
-        curr = self._edges[0]
-        self._verify_pair(prev, curr)
+        for edge in self._edges:
+            if edge._dimension != 2:
+                raise ValueError("Curve not in R^2", edge)
+
+        # NOTE: Each endpoint is sliced out of the edge nodes exactly once
+        #       and re-used by the pairwise fallback below. The ``j``-th
+        #       start is the start of the edge following edge ``j``.
+        end_nodes = [edge._nodes[:, -1] for edge in self._edges]
+        rotated = self._edges[1:] + self._edges[:1]
+        start_nodes = [edge._nodes[:, 0] for edge in rotated]
+        ends = np.column_stack(end_nodes)
+        starts = np.column_stack(start_nodes)
+        # NOTE: Shared endpoints are very often bit-for-bit identical, in
+        #       which case comparing the raw bytes is enough and avoids
+        #       computing any norms.
+        if ends.tobytes() == starts.tobytes():
+            return
+
+        if _py_helpers.vectors_close(ends, starts, eps=eps):
+            return
+
+        # If the batched check fails, check each pair to find the offender.
+        # Using ``rotated`` means the final pair wraps around from the last
+        # edge to the first.
+        for index in range(self._num_sides):
+            end = end_nodes[index]
+            start = start_nodes[index]
+            # NOTE: Since the edges are 2D, exactly matching endpoints can be
+            #       detected with two ``float`` comparisons.
+            if end[0] == start[0] and end[1] == start[1]:
+                continue
+
+            if not _helpers.vector_close(end, start, eps=eps):
+                raise ValueError(
+                    "Not sufficiently close",
+                    "Consecutive sides do not have common endpoint",
+                    self._edges[index],
+                    rotated[index],
+                )
 
     @property
     def num_sides(self):
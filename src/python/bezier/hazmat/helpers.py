@@ -73,6 +73,45 @@ def vector_close(vec1, vec2, eps=_EPS):
         return np.linalg.norm(vec1 - vec2, ord=2) <= upper_bound
 
 
+def vectors_close(mat1, mat2, eps=_EPS):
+    r"""Checks that each pair of columns are equal to some threshold.
+
+    This is a vectorized version of :func:`vector_close`, i.e. for each
+    column :math:`v_1` of ``mat1`` and corresponding column :math:`v_2`
+    of ``mat2`` it checks that
+
+    .. math::
+
+       \|v_1 - v_2\|_2 \leq \varepsilon \min(s_1, s_2)
+
+    (or the zero vector variant of this check). This allows comparing
+    many vectors at once with only a handful of NumPy calls.
+
+    Args:
+        mat1 (numpy.ndarray): First matrix (2D) of column vectors for
+            comparison.
+        mat2 (numpy.ndarray): Second matrix (2D) of column vectors for
+            comparison. Must have the same shape as ``mat1``.
+        eps (float): Error threshold. Defaults to :math:`2^{-40}`.
+
+    Returns:
+        bool: Flag indicating if every pair of columns are close to
+        precision.
+    """
+    sizes1 = np.linalg.norm(mat1, ord=2, axis=0)
+    sizes2 = np.linalg.norm(mat2, ord=2, axis=0)
+    # NOTE: When one of the columns is the zero vector, the norm of the
+    #       difference is just the norm of the other column, so comparing
+    #       it to ``eps`` matches the zero vector case in ``vector_close()``.
+    upper_bounds = np.where(
+        (sizes1 == 0.0) | (sizes2 == 0.0),
+        eps,
+        eps * np.minimum(sizes1, sizes2),
+    )
+    differences = np.linalg.norm(mat1 - mat2, ord=2, axis=0)
+    return np.all(differences <= upper_bounds)
+
+
 def in_interval(value, start, end):
     """Checks if a ``value`` is an interval (inclusive).
 
@@ -21,6 +21,8 @@
    import bezier
 """
 
+import math
+
 import numpy as np
 
 from bezier import _base
@@ -44,6 +46,9 @@ _LOCATE_ERROR_TEMPLATE = (
     "Instead the point {} has dimensions {}."
 )
 _STRATEGY = intersection_helpers.IntersectionStrategy
+# NOTE: Nearly all triangles used in practice have small degree, so the
+#       degree for the first few triangular numbers is pre-computed.
+_DEGREE_TABLE = {(d + 1) * (d + 2) // 2: d for d in range(33)}
 
 
 class Triangle(_base.Base):
@@ -240,11 +245,19 @@ class Triangle(_base.Base):
             int: The degree :math:`d` such that :math:`(d + 1)(d + 2)/2`
             equals ``num_nodes``.
         """
+        degree = _DEGREE_TABLE.get(num_nodes)
+        if degree is not None:
+            return degree
+
         # 8 * num_nodes = 4(d + 1)(d + 2)
         #               = 4d^2 + 12d + 8
         #               = (2d + 3)^2 - 1
-        d_float = 0.5 * (np.sqrt(8.0 * num_nodes + 1.0) - 3.0)
-        return int(np.round(d_float))
+        # so d = (sqrt(8 * num_nodes + 1) - 3) / 2. Rounding this to the
+        # nearest integer is the same as floor(sqrt(8 * num_nodes + 1) / 2) - 1
+        # (there are no ties since 8 * num_nodes + 1 is odd).
+        # NOTE: Using an integer square root keeps this exact even when
+        #       ``num_nodes`` is too large to be represented as a ``float``.
+        return _isqrt(8 * num_nodes + 1) // 2 - 1
 
     def _verify_degree(self, verify):
         """Verify that the number of nodes matches the degree.
@@ -1250,3 +1263,25 @@ def _make_intersection(edge_info, all_edge_nodes):
     return curved_polygon.CurvedPolygon(
         *edges, metadata=edge_info, _verify=False
     )
+
+
+def _isqrt(value):
+    """Compute the integer square root of a non-negative integer.
+
+    This is equivalent to :func:`math.isqrt`, which is not available
+    before Python 3.8.
+
+    Args:
+        value (int): The value to take the square root of.
+
+    Returns:
+        int: The largest integer ``root`` such that ``root * root <= value``.
+    """
+    root = int(math.sqrt(value))
+    # NOTE: The floating point estimate may be off (in either direction)
+    #       once ``value`` exceeds the 53 bits of precision in a ``float``.
+    while root * root > value:
+        root -= 1
+    while (root + 1) * (root + 1) <= value:
+        root += 1
+    return root
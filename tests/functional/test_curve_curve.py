@@ -221,22 +221,20 @@ def intersection_values(intersection_info, strategy):
     s_vals, t_vals, intersection_pts = intersection_info.params
     computed = np.zeros((6, intersection_info.num_params), order="F")
     exact = np.zeros(computed.shape, order="F")
-    info = zip(intersections.T, s_vals, t_vals, intersection_pts.T)
-    for index, (intersection, s_val, t_val, point) in enumerate(info):
-        computed[(0, 1), index] = intersection
-        exact[(0, 1), index] = s_val, t_val
-        # Make sure the point corresponding to the parameter on curve 1
-        # is close to the exact one.
-        computed[(2, 3), index] = intersection_info.curve1.evaluate(s_val)[
-            :, 0
-        ]
-        exact[(2, 3), index] = point
-        # Make sure the point corresponding to the parameter on curve 2
-        # is close to the exact one.
-        computed[(4, 5), index] = intersection_info.curve2.evaluate(t_val)[
-            :, 0
-        ]
-        exact[(4, 5), index] = point
+    if intersection_info.num_params == 0:
+        return computed, exact
+
+    computed[:2, :] = intersections
+    exact[0, :] = s_vals
+    exact[1, :] = t_vals
+    # Make sure the points corresponding to the parameters on curve 1
+    # are close to the exact ones.
+    computed[2:4, :] = intersection_info.curve1.evaluate_multi(s_vals)
+    exact[2:4, :] = intersection_pts
+    # Make sure the points corresponding to the parameters on curve 2
+    # are close to the exact ones.
+    computed[4:, :] = intersection_info.curve2.evaluate_multi(t_vals)
+    exact[4:, :] = intersection_pts
     return computed, exact
 
 
@@ -58,6 +58,48 @@ class Test_vector_close(unittest.TestCase):
         self.assertFalse(self._call_function_under_test(vec1, vec2))
 
 
+class Test_vectors_close(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(mat1, mat2, **kwargs):
+        from bezier.hazmat import helpers
+
+        return helpers.vectors_close(mat1, mat2, **kwargs)
+
+    def test_identical(self):
+        mat1 = np.asfortranarray([[0.5, 0.0], [4.0, 1.0]])
+        self.assertTrue(self._call_function_under_test(mat1, mat1))
+
+    def test_one_far_apart(self):
+        mat1 = np.asfortranarray([[2.25, 0.0], [-3.5, 6.0]])
+        mat2 = np.asfortranarray([[2.25, 1.0], [-3.5, -4.0]])
+        self.assertFalse(self._call_function_under_test(mat1, mat2))
+
+    def test_close_but_different(self):
+        mat1 = np.asfortranarray([[2.25, 1.0], [-3.5, 1.0]])
+        mat2 = mat1 + np.asfortranarray([[-5.0, 3.0], [12.0, 4.0]]) / 2.0 ** 43
+        self.assertTrue(self._call_function_under_test(mat1, mat2))
+
+    def test_custom_epsilon(self):
+        mat1 = np.asfortranarray([[3.0, 1.0], [4.0, 1.0]])
+        mat2 = np.asfortranarray([[2.0, 1.0], [5.0, 1.0]])
+        self.assertTrue(self._call_function_under_test(mat1, mat2, eps=0.5))
+        self.assertFalse(self._call_function_under_test(mat1, mat2))
+
+    def test_near_zero(self):
+        mat1 = np.asfortranarray([[0.0, 3.0], [0.0, 4.0]])
+        mat2 = np.asfortranarray(
+            [[3.0 / 2.0 ** 45, 3.0], [4.0 / 2.0 ** 45, 4.0]]
+        )
+        self.assertTrue(self._call_function_under_test(mat1, mat2))
+        self.assertTrue(self._call_function_under_test(mat2, mat1))
+
+    def test_near_zero_fail(self):
+        mat1 = np.asfortranarray([[1.0 / 2.0 ** 20, 3.0], [0.0, 4.0]])
+        mat2 = np.asfortranarray([[0.0, 3.0], [0.0, 4.0]])
+        self.assertFalse(self._call_function_under_test(mat1, mat2))
+        self.assertFalse(self._call_function_under_test(mat2, mat1))
+
+
 class Test_in_interval(unittest.TestCase):
     @staticmethod
     def _call_function_under_test(value, start, end):
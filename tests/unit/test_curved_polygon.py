@@ -71,6 +71,16 @@ class TestCurvedPolygon(utils.NumPyTestCase):
         self.assertEqual(curved_poly._num_sides, 2)
         self.assertEqual(curved_poly._metadata, metadata)
 
+    def test_constructor_ignores_unknown_kwargs(self):
+        import bezier
+
+        edge0 = bezier.Curve(self.NODES0, 2)
+        edge1 = bezier.Curve(self.NODES1, 2)
+        curved_poly = self._make_one(edge0, edge1, unknown=10)
+        self.assertEqual(curved_poly._edges, (edge0, edge1))
+        self.assertEqual(curved_poly._num_sides, 2)
+        self.assertIsNone(curved_poly._metadata)
+
     def test__verify_too_few(self):
         with self.assertRaises(ValueError):
             self._make_one()
@@ -94,6 +104,60 @@ class TestCurvedPolygon(utils.NumPyTestCase):
         with self.assertRaises(ValueError):
             self._make_one(edge0, edge1)
 
+    def test__verify_close_but_different(self):
+        import bezier
+
+        edge0 = bezier.Curve(self.NODES0, 2)
+        nodes1 = self.NODES1 + np.asfortranarray(
+            [[-3.0, 0.0, 0.0], [4.0, 0.0, 0.0]]
+        ) / (2.0 ** 43)
+        edge1 = bezier.Curve(nodes1, 2)
+        curved_poly = self._make_one(edge0, edge1)
+        self.assertEqual(curved_poly._edges, (edge0, edge1))
+
+    def test__verify_custom_epsilon(self):
+        import bezier
+
+        edge0 = bezier.Curve(self.NODES0, 2)
+        nodes1 = self.NODES1 + np.asfortranarray(
+            [[-5.0, 0.0, 0.0], [12.0, 0.0, 0.0]]
+        ) / (2.0 ** 43)
+        edge1 = bezier.Curve(nodes1, 2)
+        with self.assertRaises(ValueError):
+            self._make_one(edge0, edge1)
+        curved_poly = self._make_one(edge0, edge1, eps=0.5 ** 39)
+        self.assertEqual(curved_poly._edges, (edge0, edge1))
+
+    @unittest.mock.patch(
+        "bezier.hazmat.helpers.vectors_close", return_value=False
+    )
+    def test__verify_pairwise_fallback(self, vectors_close):
+        import bezier
+
+        edge0 = bezier.Curve(self.NODES0, 2)
+        nodes1 = self.NODES1 + np.asfortranarray(
+            [[-3.0, 0.0, 0.0], [4.0, 0.0, 0.0]]
+        ) / (2.0 ** 43)
+        edge1 = bezier.Curve(nodes1, 2)
+        curved_poly = self._make_one(edge0, edge1)
+        self.assertEqual(curved_poly._edges, (edge0, edge1))
+        # Verify mock.
+        vectors_close.assert_called_once()
+
+    def test__verify_not_closed(self):
+        import bezier
+
+        edge0 = bezier.Curve(self.NODES0, 2)
+        nodes1 = np.asfortranarray([[1.0, 1.0], [0.0, 1.0]])
+        edge1 = bezier.Curve(nodes1, 1)
+        nodes2 = np.asfortranarray([[1.0, 0.0], [1.0, 0.5]])
+        edge2 = bezier.Curve(nodes2, 1)
+        with self.assertRaises(ValueError) as exc_info:
+            self._make_one(edge0, edge1, edge2)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args[-2:], (edge2, edge0))
+
     def test_num_sides_property(self):
         curved_poly = self._make_default()
         self.assertIs(curved_poly.num_sides, 2)
@@ -129,6 +129,25 @@ class TestTriangle(utils.NumPyTestCase):
         self.assertEqual(3, klass._get_degree(10))
         self.assertEqual(11, klass._get_degree(78))
 
+    def test__get_degree_table(self):
+        from bezier import triangle
+
+        klass = self._get_target_class()
+        table_items = tuple(triangle._DEGREE_TABLE.items())
+        for num_nodes, degree in table_items:
+            self.assertEqual(2 * num_nodes, (degree + 1) * (degree + 2))
+            self.assertEqual(degree, klass._get_degree(num_nodes))
+        # Make sure the table agrees with the computed degree.
+        with unittest.mock.patch.dict(triangle._DEGREE_TABLE, clear=True):
+            for num_nodes, degree in table_items:
+                self.assertEqual(degree, klass._get_degree(num_nodes))
+
+    def test__get_degree_large(self):
+        klass = self._get_target_class()
+        degree = 2 ** 30 + 7
+        num_nodes = (degree + 1) * (degree + 2) // 2
+        self.assertEqual(degree, klass._get_degree(num_nodes))
+
     def test_area_property_wrong_dimension(self):
         nodes = np.asfortranarray(
             [[0.0, 0.0, 0.0], [1.0, 2.0, 0.0], [2.0, 3.0, 0.0]]
@@ -856,3 +875,30 @@ class Test__make_intersection(utils.NumPyTestCase):
         # Fourth edge.
         expected = np.asfortranarray([[0.0, 0.0], [0.25, 0.0]])
         self.assertEqual(edge3._nodes, expected)
+
+
+class Test__isqrt(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(value):
+        from bezier import triangle
+
+        return triangle._isqrt(value)
+
+    def test_perfect_square(self):
+        self.assertEqual(self._call_function_under_test(0), 0)
+        self.assertEqual(self._call_function_under_test(1), 1)
+        self.assertEqual(self._call_function_under_test(81), 9)
+
+    def test_not_perfect_square(self):
+        self.assertEqual(self._call_function_under_test(2), 1)
+        self.assertEqual(self._call_function_under_test(80), 8)
+
+    def test_estimate_too_small(self):
+        root = 2 ** 60 + 1
+        self.assertEqual(self._call_function_under_test(root * root), root)
+
+    def test_estimate_too_large(self):
+        root = 2 ** 40 + 3
+        self.assertEqual(
+            self._call_function_under_test(root * root - 1), root - 1
+        )